@@ -0,0 +1,18 @@
+import asyncio
+from playwright.async_api import async_playwright
+
+from verification_utils import CDP_PORT, LAUNCH_ARGS
+
+# Keeps one Chromium running so that repeated verification runs can attach to
+# it over CDP (PW_CDP=http://localhost:9222) rather than launching their own.
+async def main():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True, args=LAUNCH_ARGS + [f"--remote-debugging-port={CDP_PORT}"])
+        print(f"Chromium is listening on http://localhost:{CDP_PORT}")
+        print(f"Run scripts with PW_CDP=http://localhost:{CDP_PORT} to reuse it.")
+        await asyncio.get_running_loop().run_in_executor(None, input, "Press Enter to stop\n")
+        await browser.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import sys
+import traceback
+from playwright.async_api import async_playwright
+
+from verification_utils import launch_browser
+
+import verify_demo_screen
+import verify_pause_fix
+import verify_rapid_clicks
+import verify_robust_serve
+
+# Every verification scenario exposes `async def run(page)`, which returns
+# False (or raises) when the check fails.
+# They are all driven from one Chromium instance so that the browser
+# start-up cost is paid only once for the whole suite.
+SCENARIOS = [
+    verify_demo_screen,
+    verify_pause_fix,
+    verify_rapid_clicks,
+    verify_robust_serve,
+]
+
+async def run_scenario(context, scenario):
+    page = await context.new_page()
+    try:
+        return await scenario.run(page) is not False
+    finally:
+        await page.close()
+        # Contexts are reused, so reset the state a scenario may leave behind
+        await context.clear_cookies()
+        await context.clear_permissions()
+
+async def worker(context, queue, results):
+    while True:
+        try:
+            scenario = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        print(f"--- {scenario.__name__} ---")
+        # A failing scenario must not take the worker (and the scenarios
+        # still queued behind it) down with it.
+        try:
+            results[scenario.__name__] = await run_scenario(context, scenario)
+        except Exception:
+            traceback.print_exc()
+            results[scenario.__name__] = False
+
+async def main(workers=1):
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            # One long-lived context per worker; scenarios are dispatched to
+            # whichever worker is free instead of creating a context each.
+            context_pool = [await browser.new_context() for _ in range(workers)]
+            queue = asyncio.Queue()
+            for scenario in SCENARIOS:
+                queue.put_nowait(scenario)
+            results = {}
+            await asyncio.gather(*(worker(c, queue, results) for c in context_pool))
+        finally:
+            await browser.close()
+
+    print("--- summary ---")
+    for scenario in SCENARIOS:
+        print(f"{'PASS' if results[scenario.__name__] else 'FAIL'}: {scenario.__name__}")
+    return all(results.values())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of scenarios to run concurrently")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(main(workers=max(1, args.workers))) else 1)
@@ -270,13 +270,13 @@ export class Ball {
 
     private ballDead() { if (this.status >= 0) { this.status = BallStatus.DEAD; } }
 
-    public toss(player: Player, power: number) {
+    public toss(player: Pick<Player, 'side'>, power: number) {
         this.velocity.y = power;
         this.spin.set(0, 0);
         this.status = player.side > 0 ? BallStatus.TOSS_P1 : BallStatus.TOSS_P2;
     }
 
-    public reset(player: Player) {
+    public reset(player: Pick<Player, 'side' | 'swingType' | 'mesh'>) {
         const serveParams = stype.get(player.swingType);
         if (!serveParams) return;
         const playerPos = player.mesh.position;
@@ -500,7 +500,7 @@ export class Ball {
     }
 
 
-    public targetToVS(player: Player, target: THREE.Vector2, level: number, spin: THREE.Vector2): THREE.Vector3 {
+    public targetToVS(player: Pick<Player, 'side'>, target: THREE.Vector2, level: number, spin: THREE.Vector2): THREE.Vector3 {
         const initialBallPos = this.mesh.position;
         const initialBallPos2D = new THREE.Vector2(initialBallPos.x, initialBallPos.z);
         let bestVelocity = INVALID_VELOCITY.clone();
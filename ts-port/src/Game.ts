@@ -2,7 +2,7 @@ import * as THREE from 'three';
 import type { GameAssets } from './AssetManager';
 import { Player } from './Player';
 
-import { Ball } from './Ball';
+import { Ball, BallStatus } from './Ball';
 import { Field } from './Field';
 import { AIController } from './AIController';
 import { TABLE_HEIGHT, TABLE_LENGTH, AILevel, TICK } from './constants';
@@ -21,6 +21,21 @@ const PLAYER_INITIAL_Y = 0.77;
 const PLAYER_Z_OFFSET = 0.2;
 const BALL_INITIAL_Y_OFFSET = 0.1;
 
+// Upper bound on how long startServe() waits for a serve to be resolved
+const SERVE_TIMEOUT_MS = 10000;
+
+
+/**
+ * The result of one serve played by `Game.startServe`.
+ */
+export interface ServeOutcome {
+    /** Player 1's position when serving (x, y, z). */
+    position: [number, number, number];
+    /** Ball status the serve ended with: a RALLY_* status if it was good. */
+    status: BallStatus;
+    /** Ball positions sampled from the toss until the serve was resolved. */
+    trace: number[][];
+}
 
 /**
  * Defines the contract for all game modes.
@@ -51,6 +66,8 @@ export class Game implements IGameScoringContext, IGameInputContext {
     private inputController!: InputController;
     private uiManager?: UIManager;
     private prevBallStatus = 0;
+    private isServeInFlight = false;
+    private serveTrace: number[][] = [];
 
     // Game state properties
     private currentMode!: IGameMode;
@@ -75,6 +92,7 @@ export class Game implements IGameScoringContext, IGameInputContext {
         this.isPaused = false;
         this.aiLevel = aiLevel;
         this.scoreManager.reset();
+        this.isServeInFlight = false;
 
 
         // Clear previous game objects from the scene
@@ -190,6 +208,8 @@ export class Game implements IGameScoringContext, IGameInputContext {
             this.player2.setState('IDLE');
         }
 
+        this.checkServeCompletion();
+
         // Delegate mode-specific logic to the current state object
         this.currentMode.update(deltaTime, this);
 
@@ -197,6 +217,35 @@ export class Game implements IGameScoringContext, IGameInputContext {
         this.prevBallStatus = this.ball.status;
     }
 
+    /**
+     * Dispatches a `servedone` event once a serve has been resolved, i.e. the
+     * ball has either become a rally ball for the receiver or gone dead.
+     * Tracking starts at the toss, so a toss that is never struck is reported too.
+     * The ball positions sampled during the serve are attached to the event,
+     * so verification scripts can read them once instead of logging each frame.
+     */
+    private checkServeCompletion() {
+        const status = this.ball.status;
+        if (status === BallStatus.TOSS_P1 || status === BallStatus.TOSS_P2 ||
+            status === BallStatus.SERVE_TO_AI || status === BallStatus.SERVE_TO_HUMAN) {
+            if (!this.isServeInFlight) {
+                this.serveTrace = [];
+            }
+            this.isServeInFlight = true;
+        }
+        if (!this.isServeInFlight) {
+            return;
+        }
+
+        const { x, y, z } = this.ball.mesh.position;
+        this.serveTrace.push([x, y, z]);
+
+        if (status < 0 || status === BallStatus.RALLY_TO_AI || status === BallStatus.RALLY_TO_HUMAN) {
+            this.isServeInFlight = false;
+            document.dispatchEvent(new CustomEvent('servedone', { detail: { status, trace: this.serveTrace } }));
+        }
+    }
+
     // --- State Management ---
 
     public getIsPaused(): boolean {
@@ -225,4 +274,48 @@ export class Game implements IGameScoringContext, IGameInputContext {
         this.uiManager?.showDemoScreen();
     }
 
+    /**
+     * Starts a new match and has Player 1 serve from the given position,
+     * as a left click would. A new match means Player 1 always has the service.
+     * @param position Player 1's position (x, y, z) when serving.
+     * @returns The outcome, resolved once the serve has been resolved. If it is
+     * not resolved within SERVE_TIMEOUT_MS, the ball's status at that time is used.
+     */
+    public startServe(position: [number, number, number]): Promise<ServeOutcome> {
+        this.start(this.aiLevel);
+        this.uiManager?.showGameScreen();
+        this.player1.mesh.position.set(...position);
+
+        const done = new Promise<ServeOutcome>((resolve) => {
+            const finish = (status: BallStatus, trace: number[][]) => {
+                clearTimeout(timer);
+                document.removeEventListener('servedone', onServeDone);
+                resolve({ position, status, trace });
+            };
+            const onServeDone = (event: Event) => {
+                const { status, trace } = (event as CustomEvent).detail;
+                finish(status, trace);
+            };
+            const timer = setTimeout(() => finish(this.ball.status, this.serveTrace), SERVE_TIMEOUT_MS);
+            document.addEventListener('servedone', onServeDone);
+        });
+        this.player1.startServe(1);
+        this.ball.reset(this.player1);
+        return done;
+    }
+
+    /**
+     * Plays one serve by Player 1 from each position in turn.
+     * Lets verification scripts test several positions in a single page load.
+     * @param positions Player 1's position (x, y, z) for each serve.
+     * @returns One outcome per position, resolved once the last serve is over.
+     */
+    public async runServesFromPositions(positions: [number, number, number][]): Promise<ServeOutcome[]> {
+        const outcomes: ServeOutcome[] = [];
+        for (const position of positions) {
+            outcomes.push(await this.startServe(position));
+        }
+        return outcomes;
+    }
+
 }
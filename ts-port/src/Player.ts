@@ -9,7 +9,7 @@ import {
 import { Ball, BallStatus } from './Ball';
 import { AIController } from './AIController';
 import type { Game } from './Game';
-import { stype, SWING_NORMAL, SWING_POKE, SWING_SMASH, SWING_DRIVE, SWING_CUT, SWING_BLOCK, SERVE_MIN, SERVE_MAX, SERVE_NORMAL, SERVE_POKE, SERVE_SIDESPIN1, SERVE_SIDESPIN2 } from './SwingTypes';
+import { stype, getServeSpin, SWING_NORMAL, SWING_POKE, SWING_SMASH, SWING_DRIVE, SWING_CUT, SWING_BLOCK, SERVE_MIN, SERVE_MAX, SERVE_NORMAL, SERVE_HIT_LEVEL } from './SwingTypes';
 import { PlayerType, PLAYER_TYPES, type PlayerAttributes } from './PlayerTypes';
 
 // Player spin constants
@@ -19,14 +19,8 @@ export const SPIN_DRIVE = 0.8;
 export const SPIN_SMASH = 0.2;
 export const SPIN_CUT = -0.8;
 
-// Corresponds to SERVEPARAM in Player.h
-export const SERVEPARAM: number[][] = [
-    [SERVE_NORMAL, 0.0, 0.0, 0.0, 0.1, 0.0, 0.2],
-    [SERVE_POKE, 0.0, 0.0, 0.0, -0.3, 0.0, -0.6],
-    [SERVE_SIDESPIN1, -0.6, 0.2, -0.8, 0.0, -0.6, -0.2],
-    [SERVE_SIDESPIN2, 0.6, 0.2, 0.8, 0.0, 0.6, -0.2],
-    [-1, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-];
+// Re-exported for backwards compatibility
+export { SERVEPARAM } from './SwingTypes';
 
 // --- Status System Constants (from Player.h) ---
 export const STATUS_MAX = 200;
@@ -59,7 +53,6 @@ const PLAYER_VELOCITY_LERP_FACTOR = 0.1;
 const AUTO_MOVE_DISTANCE_THRESHOLD = 0.05;
 
 const AI_ERROR_POSITION_SENSITIVITY = 0.5;
-const SERVE_HIT_LEVEL = 0.9;
 
 export type PlayerState = 'IDLE' | 'BACKSWING' | 'SWING_DRIVE' | 'SWING_CUT';
 
@@ -309,14 +302,8 @@ export class Player {
         if (this.swing > 0) return false;
         this.swingType = SERVE_NORMAL;
         this.swing = 1;
-        const params = SERVEPARAM.find(p => p[0] === this.swingType);
-        if (params) {
-            this.spin.x = params[(spinCategory - 1) * 2 + 1];
-            this.spin.y = params[(spinCategory - 1) * 2 + 2];
-        } else {
-            this.spin.x = 0;
-            this.spin.y = 0;
-        }
+        const serveSpin = getServeSpin(this.swingType, spinCategory);
+        this.spin.set(serveSpin.x, serveSpin.y);
         this.playAnimation('Fcut', false);
 
         // Adjust timeScale for serve to match physics hit timing
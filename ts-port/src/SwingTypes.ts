@@ -41,3 +41,29 @@ export const stype: Map<number, SwingType> = new Map([
   [SERVE_SIDESPIN1, { type: SERVE_SIDESPIN1, toss: 20, backswing: 60, hitStart: 80, hitEnd: 80, swingEnd: 95, swingLength: 150, hitX: 0.0, hitY: 0.0, tossV: 3.2 }],
   [SERVE_SIDESPIN2, { type: SERVE_SIDESPIN2, toss: 20, backswing: 80, hitStart: 100, hitEnd: 100, swingEnd: 120, swingLength: 200, hitX: 0.0, hitY: 0.0, tossV: 4.0 }],
 ]);
+
+// Corresponds to SERVEPARAM in Player.h
+export const SERVEPARAM: number[][] = [
+  [SERVE_NORMAL, 0.0, 0.0, 0.0, 0.1, 0.0, 0.2],
+  [SERVE_POKE, 0.0, 0.0, 0.0, -0.3, 0.0, -0.6],
+  [SERVE_SIDESPIN1, -0.6, 0.2, -0.8, 0.0, -0.6, -0.2],
+  [SERVE_SIDESPIN2, 0.6, 0.2, 0.8, 0.0, 0.6, -0.2],
+  [-1, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+];
+
+// The level passed to Ball.targetToVS for every serve
+export const SERVE_HIT_LEVEL = 0.9;
+
+/**
+ * Looks up the spin applied by a serve.
+ * @param swingType One of the SERVE_* swing types.
+ * @param spinCategory 1-3, chosen by the mouse button used to serve.
+ * @returns The side spin (x) and top/back spin (y), or no spin if the serve is unknown.
+ */
+export function getServeSpin(swingType: number, spinCategory: number): { x: number, y: number } {
+  const params = SERVEPARAM.find(p => p[0] === swingType);
+  if (!params) {
+    return { x: 0, y: 0 };
+  }
+  return { x: params[(spinCategory - 1) * 2 + 1], y: params[(spinCategory - 1) * 2 + 2] };
+}
@@ -40,6 +40,11 @@ async function main() {
   const uiManager = new UIManager(demoScreen, pauseScreen);
 
   const game = new Game(scene, camera, assets, uiManager);
+  // Exposed so that the verification scripts can drive the game directly.
+  // Dev server only: production builds must not be scriptable this way.
+  if (import.meta.env.DEV) {
+    window.game = game;
+  }
 
   // --- Event Listeners ---
 
@@ -111,13 +116,20 @@ async function main() {
     return needResize;
   }
 
+  // ?speed=N runs N game steps per frame's worth of real time, so that
+  // verification scripts can wait on in-game time without the wall-clock cost.
+  // Like window.game, this is only honoured on the dev server.
+  const speedParam = import.meta.env.DEV ? Number(new URLSearchParams(window.location.search).get('speed')) : 0;
+  const gameSpeed = speedParam > 0 ? speedParam : 1;
+
   let accumulatedTime = 0;
   let totalRealTime = 0;
   let totalGameTime = 0;
+  let isFirstFrame = true;
 
   function render() {
     const deltaTime = clock.getDelta();
-    accumulatedTime += deltaTime;
+    accumulatedTime += deltaTime * gameSpeed;
     totalRealTime += deltaTime;
 
     if (resizeRendererToDisplaySize(renderer)) {
@@ -129,7 +141,7 @@ async function main() {
     // Fixed time step update
     // Prevent spiral of death by clamping max steps per frame
     let steps = 0;
-    const MAX_STEPS = 5;
+    const MAX_STEPS = Math.ceil(5 * gameSpeed);
     while (accumulatedTime >= TICK && steps < MAX_STEPS) {
       // Save current positions as previous for interpolation
       game.ball.prevPosition.copy(game.ball.mesh.position);
@@ -162,6 +174,12 @@ async function main() {
 
     renderer.render(scene, camera);
 
+    if (isFirstFrame) {
+      // Assets are loaded and the scene has been drawn at least once
+      window.__gameReady = true;
+      isFirstFrame = false;
+    }
+
     // Restore true physics positions for the next update
     game.ball.mesh.position.copy(ballTruePos);
     game.player1.mesh.position.copy(p1TruePos);
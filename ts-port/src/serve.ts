@@ -0,0 +1,70 @@
+import * as THREE from 'three';
+import { Ball, BallStatus } from './Ball';
+import { stype, getServeSpin, SERVE_NORMAL, SERVE_HIT_LEVEL } from './SwingTypes';
+import { TICK } from './constants';
+
+// Upper bound on simulated frames after the hit, in case a serve never resolves
+const SERVE_SIMULATION_MAX_FRAMES = 1000;
+
+export interface ServeOptions {
+    /** Position of the serving player (x, y, z). */
+    startPos: [number, number, number];
+    /** Point on the receiver's court the serve is aimed at (x, z). */
+    target: [number, number];
+    /** Mouse button used to serve: 0 = left, 1 = middle, 2 = right. */
+    button: number;
+    /** The serving side: 1 for Player 1 (+Z), -1 for Player 2 (-Z). */
+    side?: number;
+}
+
+export interface ServeResult {
+    /** Ball status once the serve was resolved (a RALLY_* status or dead). */
+    status: BallStatus;
+    /** Initial velocity given to the ball by the serve. */
+    velocity: [number, number, number];
+    /** Ball position for every frame from the hit until the serve was resolved. */
+    trace: number[][];
+}
+
+/**
+ * Simulates a normal serve from toss to resolution without a renderer or DOM.
+ * Follows the same frame sequence as Player.startServe / Player._updateSwing,
+ * so trajectory checks can run under Node instead of a headless browser.
+ */
+export function serveTrajectory({ startPos, target, button, side = 1 }: ServeOptions): ServeResult {
+    const swingParams = stype.get(SERVE_NORMAL)!;
+    const server = { side, swingType: SERVE_NORMAL, mesh: new THREE.Group() };
+    server.mesh.position.set(...startPos);
+
+    const ball = new Ball();
+    const step = () => {
+        const oldPos = ball.mesh.position.clone();
+        ball._updatePhysics(TICK);
+        ball.checkCollision(oldPos);
+    };
+
+    // The toss happens on the first swing frame and the hit on `hitStart`;
+    // the ball flies freely for the frames in between.
+    ball.reset(server);
+    ball.toss(server, swingParams.tossV);
+    for (let swing = swingParams.toss + 1; swing < swingParams.hitStart; swing++) {
+        step();
+    }
+
+    const serveSpin = getServeSpin(SERVE_NORMAL, button + 1);
+    const spin = new THREE.Vector2(serveSpin.x, serveSpin.y);
+    const velocity = ball.targetToVS(server, new THREE.Vector2(...target), SERVE_HIT_LEVEL, spin);
+    ball.hit(velocity, spin);
+
+    const trace: number[][] = [];
+    for (let frame = 0; frame < SERVE_SIMULATION_MAX_FRAMES; frame++) {
+        step();
+        const { x, y, z } = ball.mesh.position;
+        trace.push([x, y, z]);
+        if (ball.status < 0 || ball.status === BallStatus.RALLY_TO_AI || ball.status === BallStatus.RALLY_TO_HUMAN) {
+            break;
+        }
+    }
+
+    return { status: ball.status, velocity: [velocity.x, velocity.y, velocity.z], trace };
+}
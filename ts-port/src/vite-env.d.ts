@@ -1 +1,7 @@
 /// <reference types="vite/client" />
+
+// Globals used by the Playwright verification scripts (see main.ts)
+interface Window {
+  game?: import('./Game').Game;
+  __gameReady?: boolean;
+}
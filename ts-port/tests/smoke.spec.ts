@@ -10,6 +10,9 @@ test('app loads without errors', async ({ page }) => {
   });
 
   await page.goto('/');
+  // Errors from asset loading arrive after `load`, so wait until the first
+  // frame has been drawn instead of padding with a fixed timeout.
+  await page.waitForFunction(() => window.__gameReady === true);
 
   // Check the title
   await expect(page).toHaveTitle(/CannonSmash/);
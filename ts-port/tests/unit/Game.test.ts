@@ -18,7 +18,7 @@ vi.mock('../../src/TrajectoryVisualizer');
 // Vitest will provide us with the mocked versions.
 import { Game } from '../../src/Game';
 import { Player } from '../../src/Player';
-import { Ball } from '../../src/Ball';
+import { Ball, BallStatus } from '../../src/Ball';
 import { Field } from '../../src/Field';
 import { DemoMode } from '../../src/modes/DemoMode';
 import { PlayMode } from '../../src/modes/PlayMode';
@@ -49,12 +49,15 @@ describe('Game', () => {
             this.update = vi.fn();
             this.setState = vi.fn();
             this.canInitiateSwing = vi.fn().mockReturnValue(false);
+            this.getPredictedSwing = vi.fn().mockReturnValue({ swingType: 0, spinCategory: 0 });
+            this.startServe = vi.fn();
             return this;
         });
 
         vi.mocked(Ball).mockImplementation(function () {
             this.mesh = { position: new THREE.Vector3() };
             this.update = vi.fn();
+            this.reset = vi.fn();
             this.status = 0;
             this.velocity = new THREE.Vector3();
             return this;
@@ -180,4 +183,91 @@ describe('Game', () => {
         game.update(0.016);
         expect(inputControllerInstance.handleInput).toHaveBeenCalled();
     });
+
+    it('should dispatch servedone once a served ball is resolved', () => {
+        const game = new Game(mockScene, mockCamera, mockAssets);
+        const listener = vi.fn();
+        document.addEventListener('servedone', listener);
+
+        game.ball.status = BallStatus.SERVE_TO_AI;
+        game.update(0.016);
+        game.ball.status = BallStatus.IN_PLAY_TO_AI;
+        game.update(0.016);
+        expect(listener).not.toHaveBeenCalled();
+
+        game.ball.status = BallStatus.RALLY_TO_AI;
+        game.update(0.016);
+        game.update(0.016);
+        expect(listener).toHaveBeenCalledTimes(1);
+        const detail = (listener.mock.calls[0][0] as CustomEvent).detail;
+        expect(detail.status).toBe(BallStatus.RALLY_TO_AI);
+        expect(detail.trace).toHaveLength(3);
+
+        document.removeEventListener('servedone', listener);
+    });
+
+    it('should dispatch servedone when a tossed ball dies before it is hit', () => {
+        const game = new Game(mockScene, mockCamera, mockAssets);
+        const listener = vi.fn();
+        document.addEventListener('servedone', listener);
+
+        game.ball.status = BallStatus.TOSS_P1;
+        game.update(0.016);
+        expect(listener).not.toHaveBeenCalled();
+
+        game.ball.status = BallStatus.DEAD;
+        game.update(0.016);
+        expect(listener).toHaveBeenCalledTimes(1);
+        const detail = (listener.mock.calls[0][0] as CustomEvent).detail;
+        expect(detail.status).toBe(BallStatus.DEAD);
+
+        document.removeEventListener('servedone', listener);
+    });
+
+    it('should play a serve from each requested position', async () => {
+        const game = new Game(mockScene, mockCamera, mockAssets);
+        const outcomes = game.runServesFromPositions([[0, 0.77, 1.4]]);
+
+        expect(game.isDemo()).toBe(false);
+        expect(game.player1.mesh.position.z).toBe(1.4);
+        expect(game.player1.startServe).toHaveBeenCalledWith(1);
+        expect(game.ball.reset).toHaveBeenCalledWith(game.player1);
+
+        game.ball.status = BallStatus.SERVE_TO_AI;
+        game.update(0.016);
+        game.ball.status = BallStatus.DEAD;
+        game.update(0.016);
+
+        const [outcome] = await outcomes;
+        expect(outcome.position).toEqual([0, 0.77, 1.4]);
+        expect(outcome.status).toBe(BallStatus.DEAD);
+        expect(outcome.trace).toHaveLength(2);
+    });
+
+    it('should resolve a direct serve with its outcome', async () => {
+        const game = new Game(mockScene, mockCamera, mockAssets);
+        const outcome = game.startServe([0, 0.77, 2.0]);
+
+        expect(game.player1.mesh.position.z).toBe(2.0);
+        expect(game.player1.startServe).toHaveBeenCalledWith(1);
+
+        game.ball.status = BallStatus.SERVE_TO_AI;
+        game.update(0.016);
+        game.ball.status = BallStatus.RALLY_TO_AI;
+        game.update(0.016);
+
+        await expect(outcome).resolves.toMatchObject({ position: [0, 0.77, 2.0], status: BallStatus.RALLY_TO_AI });
+    });
+
+    it('should resolve a serve that never settles once it times out', async () => {
+        vi.useFakeTimers();
+        const game = new Game(mockScene, mockCamera, mockAssets);
+        const outcome = game.startServe([0, 0.77, 1.57]);
+
+        game.ball.status = BallStatus.TOSS_P1;
+        vi.advanceTimersByTime(10000);
+
+        await expect(outcome).resolves.toMatchObject({ status: BallStatus.TOSS_P1 });
+        vi.useRealTimers();
+    });
 });
@@ -0,0 +1,38 @@
+// ts-port/tests/unit/serve.test.ts
+
+import { describe, it, expect } from 'vitest';
+import { serveTrajectory } from '../../src/serve';
+import { BallStatus } from '../../src/Ball';
+import { TABLE_LENGTH } from '../../src/constants';
+import { stype, SERVE_NORMAL } from '../../src/SwingTypes';
+// Shared with verify_robust_serve.py so that both sweep the same positions
+import positions from '../serve_positions.json';
+
+describe('serveTrajectory', () => {
+    const target: [number, number] = [0, -TABLE_LENGTH / 4];
+
+    // Test Case SV-01: Serve toward the receiver
+    it('should send the ball from the server toward the receiver', () => {
+        const result = serveTrajectory({ startPos: [0, 0.77, 1.57], target, button: 0 });
+
+        expect(result.velocity[2]).toBeLessThan(0); // Player 1 serves toward -Z
+        expect(result.trace.length).toBeGreaterThan(0);
+        // The ball is struck beside the server and then moves away from them
+        const [x, , z] = result.trace[0];
+        expect(x).toBeCloseTo(stype.get(SERVE_NORMAL)!.hitX, 1);
+        expect(z).toBeLessThan(1.57);
+    });
+
+    // Test Case SV-02: Serve is good
+    it.each(Object.entries(positions))('should land a legal serve from the %s position', (_name, zPos) => {
+        const result = serveTrajectory({ startPos: [0, 0.77, zPos], target, button: 0 });
+
+        expect(result.status).toBe(BallStatus.RALLY_TO_AI);
+    });
+
+    // Test Case SV-03: Determinism
+    it('should be deterministic for the same input', () => {
+        const options = { startPos: [0, 0.77, 1.57] as [number, number, number], target, button: 1 };
+        expect(serveTrajectory(options)).toEqual(serveTrajectory(options));
+    });
+});
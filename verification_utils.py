@@ -0,0 +1,152 @@
+import asyncio
+import base64
+import hashlib
+import os
+import time
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright
+
+TS_PORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ts-port")
+
+# Set FAST_MODE=1 to skip resources the verification scripts do not need.
+# Full-fidelity runs (the default) load everything, as a user's browser would.
+FAST_MODE = os.getenv("FAST_MODE") == "1"
+
+# Set FORCE_SCREENSHOT=1 to retake screenshots even if the game is unchanged.
+FORCE_SCREENSHOT = os.getenv("FORCE_SCREENSHOT") == "1"
+
+# Chromium flags for a lean headless start-up. With the GPU process disabled,
+# WebGL runs on SwiftShader, which three.js can still render with.
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-gpu",
+    "--enable-unsafe-swiftshader",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    # Keep requestAnimationFrame at full rate even when the page is not
+    # considered visible, since every wait on in-game time depends on it.
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+GAME_URL = "http://localhost:5173/"
+
+# Port of the long-lived browser started by browser_server.py
+CDP_PORT = 9222
+
+async def launch_browser(p):
+    # PW_CDP=http://localhost:9222 reuses the warm browser from
+    # browser_server.py instead of paying for a fresh Chromium launch.
+    # Callers open their own new_context() so that they never share state.
+    endpoint = os.getenv("PW_CDP")
+    if endpoint:
+        return await p.chromium.connect_over_cdp(endpoint)
+    return await p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+
+def run_with_browser(main, *args):
+    # Standalone entry point for a script's `async def main(browser, ...)`.
+    # The event loop, the Playwright driver and the browser are owned here,
+    # so a batch runner can call the same main() with its shared browser.
+    async def _run():
+        async with async_playwright() as p:
+            browser = await launch_browser(p)
+            try:
+                await main(browser, *args)
+            finally:
+                await browser.close()
+    asyncio.run(_run())
+
+async def wait_port(host="localhost", port=5173, timeout=30):
+    # Polls until the dev server accepts connections, so that scripts can be
+    # started right after `npm run dev` without a fixed sleep.
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 0.2)
+            writer.close()
+            await writer.wait_closed()
+            return
+        except (OSError, asyncio.TimeoutError):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{host}:{port} did not accept connections within {timeout}s")
+            await asyncio.sleep(0.05)
+
+async def open_game(page, url=GAME_URL):
+    # The Vite dev server keeps its HMR WebSocket open, so "networkidle" may
+    # never fire and "load" waits on assets the game loads by itself anyway.
+    # Stop at DOMContentLoaded and wait for the game's own readiness flag.
+    parts = urlsplit(url)
+    await wait_port(parts.hostname, parts.port)
+    await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+    await page.wait_for_function("window.__gameReady === true", timeout=15000)
+
+async def block_unneeded_resources(page, keep_textures=True):
+    if not FAST_MODE:
+        return
+    # Fonts, the favicon and any analytics never show up on the canvas
+    await page.route("**/*.{woff,woff2,ttf,otf,ico,svg}", lambda route: route.abort())
+    await page.route("**/analytics*", lambda route: route.abort())
+    if not keep_textures:
+        # Only for scenarios that inspect logs/DOM rather than the rendered scene
+        await page.route("**/*.{png,jpg,jpeg,gif}", lambda route: route.abort())
+
+async def capture_screenshot(page, path, quality=60):
+    # Grab the frame straight from the DevTools protocol. JPEG encoding is
+    # much cheaper than page.screenshot()'s PNG, and plenty for eyeballing.
+    fmt = "jpeg" if path.lower().endswith((".jpg", ".jpeg")) else "png"
+    params = {"format": fmt, "captureBeyondViewport": False}
+    if fmt == "jpeg":
+        params["quality"] = quality
+    client = await page.context.new_cdp_session(page)
+    try:
+        data = await client.send("Page.captureScreenshot", params)
+    finally:
+        await client.detach()
+    with open(path, "wb") as f:
+        f.write(base64.b64decode(data["data"]))
+
+def _screenshot_signature(script, quality):
+    # Everything the captured image depends on: the steps that lead up to it
+    # (the calling script and these helpers), how the page was loaded and
+    # encoded, and the front end itself. Sources are hashed by content;
+    # the (large) assets in public/ only by name, size and modification time.
+    digest = hashlib.sha1()
+    digest.update(f"fast_mode={FAST_MODE}:quality={quality}".encode())
+    for path in (script, __file__, os.path.join(TS_PORT_DIR, "index.html")):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    for folder, by_content in (("src", True), ("public", False)):
+        for root, dirs, files in os.walk(os.path.join(TS_PORT_DIR, folder)):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, TS_PORT_DIR).encode())
+                if by_content:
+                    with open(path, "rb") as f:
+                        digest.update(f.read())
+                else:
+                    stat = os.stat(path)
+                    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+async def maybe_screenshot(page, path, script, quality=60):
+    # Skip the capture when nothing it depends on has changed since the last
+    # one, as the screenshot would show the same thing. `script` is the
+    # caller's __file__. The signature is kept next to the image as <path>.sig.
+    sig_path = path + ".sig"
+    signature = _screenshot_signature(script, quality)
+    if not FORCE_SCREENSHOT and os.path.exists(path) and os.path.exists(sig_path):
+        with open(sig_path) as f:
+            if f.read() == signature:
+                print(f"{path} is up to date, skipping screenshot.")
+                return False
+    await capture_screenshot(page, path, quality)
+    with open(sig_path, "w") as f:
+        f.write(signature)
+    return True
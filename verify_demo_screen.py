@@ -0,0 +1,29 @@
+import argparse
+
+from verification_utils import block_unneeded_resources, maybe_screenshot, open_game, run_with_browser
+
+# Screenshot of the demo screen, used to check lighting, materials and the
+# overlay CSS. Pass --output to keep the result of each change side by side.
+DEFAULT_OUTPUT = "demo_screen.jpg"
+
+async def run(page, output=DEFAULT_OUTPUT):
+    await block_unneeded_resources(page)
+    # Returns once the dev server is up and the first frame has been drawn
+    await open_game(page)
+    await page.wait_for_selector('#demo-screen', state='visible')
+
+    await maybe_screenshot(page, output, __file__)
+
+async def main(browser, output=DEFAULT_OUTPUT):
+    context = await browser.new_context()
+    try:
+        await run(await context.new_page(), output)
+    finally:
+        await context.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="where to write the screenshot")
+    args = parser.parse_args()
+    run_with_browser(main, args.output)
@@ -1,40 +1,49 @@
-import time
-from playwright.sync_api import sync_playwright
+from verification_utils import block_unneeded_resources, maybe_screenshot, open_game, run_with_browser
 
-def run(playwright):
-    browser = playwright.chromium.launch(headless=True)
-    page = browser.new_page()
+async def run(page):
+    await block_unneeded_resources(page)
     try:
-        page.goto("http://localhost:5173/")
-        time.sleep(5)  # Wait for the demo to load
+        await open_game(page)
+
+        # Both overlays are static elements of index.html, so resolve them
+        # once and act on the handles instead of re-querying for every step.
+        demo_screen = await page.query_selector("#demo-screen")
+        pause_screen = await page.query_selector("#pause-screen")
 
         # 1. Click to start the game
-        page.locator("#demo-screen").click()
-        time.sleep(1)
+        await demo_screen.click()
+        await demo_screen.wait_for_element_state("hidden")
 
         # 2. Press ESC to pause
-        page.keyboard.press("Escape")
-        time.sleep(1)
+        await page.keyboard.press("Escape")
+        await pause_screen.wait_for_element_state("visible")
 
         # 3. Press ESC again to return to demo
-        page.keyboard.press("Escape")
-        time.sleep(1)
+        await page.keyboard.press("Escape")
+        await demo_screen.wait_for_element_state("visible")
 
         # 4. Take a screenshot to verify the fix
-        page.screenshot(path="verify_pause_fix.png")
-        print("Screenshot taken.")
+        if await maybe_screenshot(page, "verify_pause_fix.jpg", __file__, quality=40):
+            print("Screenshot taken.")
 
         # Check if pause screen is hidden
-        pause_screen_is_hidden = page.locator("#pause-screen").is_hidden()
+        pause_screen_is_hidden = await pause_screen.is_hidden()
         if pause_screen_is_hidden:
             print("SUCCESS: Pause screen is hidden.")
         else:
             print("FAILURE: Pause screen is still visible.")
+        return pause_screen_is_hidden
 
     except Exception as e:
         print(f"An error occurred: {e}")
+        return False
+
+async def main(browser):
+    context = await browser.new_context()
+    try:
+        await run(await context.new_page())
     finally:
-        browser.close()
+        await context.close()
 
-with sync_playwright() as playwright:
-    run(playwright)
+if __name__ == "__main__":
+    run_with_browser(main)
@@ -0,0 +1,52 @@
+from verification_utils import block_unneeded_resources, open_game, run_with_browser
+
+CLICK_COUNT = 20
+CLICK_INTERVAL_MS = 200
+
+# Fires every click from inside the page, so the whole burst costs one
+# round trip. The input manager samples buttons once per frame, so each
+# press is held for a frame instead of releasing it straight away.
+CLICK_DRIVER_JS = """async ({ count, interval }) => {
+    const canvas = document.querySelector('#c');
+    const nextFrame = () => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+    for (let i = 0; i < count; i++) {
+        const start = performance.now();
+        canvas.dispatchEvent(new MouseEvent('mousedown', { button: 0, bubbles: true }));
+        await nextFrame();
+        canvas.dispatchEvent(new MouseEvent('mouseup', { button: 0, bubbles: true }));
+        const remaining = interval - (performance.now() - start);
+        await new Promise(r => setTimeout(r, Math.max(0, remaining)));
+    }
+}"""
+
+async def run(page):
+    await block_unneeded_resources(page, keep_textures=False)
+    await open_game(page)
+
+    # Start a match, then click repeatedly through serves and swings
+    await page.locator("#demo-screen").click()
+    await page.wait_for_selector("#demo-screen", state="hidden")
+    await page.evaluate(CLICK_DRIVER_JS, {"count": CLICK_COUNT, "interval": CLICK_INTERVAL_MS})
+
+    # Once the last swing is over, the player must be back in a running
+    # animation; with no action playing the model falls back to its T-pose.
+    await page.wait_for_function("window.game.player1.swing === 0", timeout=10000)
+    animation = await page.evaluate("""() => {
+        const action = window.game.player1.currentAction;
+        return action && action.isRunning() ? action.getClip().name : null;
+    }""")
+    if animation:
+        print(f"SUCCESS: Player 1 is playing '{animation}' after {CLICK_COUNT} clicks.")
+    else:
+        print(f"FAILURE: Player 1 has no running animation after {CLICK_COUNT} clicks.")
+    return animation is not None
+
+async def main(browser):
+    context = await browser.new_context()
+    try:
+        await run(await context.new_page())
+    finally:
+        await context.close()
+
+if __name__ == "__main__":
+    run_with_browser(main)
@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from verification_utils import GAME_URL, TS_PORT_DIR, block_unneeded_resources, open_game, run_with_browser
+
+# Player 1's depth (z) before serving. The end of the table is at z=1.37.
+# Shared with tests/unit/serve.test.ts so that --node sweeps the same positions.
+with open(os.path.join(TS_PORT_DIR, "tests", "serve_positions.json")) as f:
+    POSITIONS_TO_TEST = json.load(f)
+
+# BallStatus.RALLY_TO_AI in ts-port/src/Ball.ts: the serve landed and the AI
+# is to return it. Player 1 always has the service, so this is a good serve.
+RALLY_TO_AI = 0
+
+# The game gives up on a serve after 10s; this also bounds a stuck page
+SERVE_TIMEOUT = 15
+
+async def run(page):
+    # Buffer browser logs and print them once the serves are over
+    logs = []
+    page.on("console", lambda msg: logs.append((msg.type, msg.text)))
+    try:
+        await block_unneeded_resources(page, keep_textures=False)
+        # Run the game loop at 4x so that the serves finish sooner
+        await open_game(page, f"{GAME_URL}?speed=4")
+
+        # The game plays every serve in turn and resolves with all the
+        # outcomes, so one page load and one round trip cover the sweep.
+        positions = [[0, 0.77, z] for z in POSITIONS_TO_TEST.values()]
+        try:
+            outcomes = await asyncio.wait_for(
+                page.evaluate("positions => window.game.runServesFromPositions(positions)", positions),
+                timeout=SERVE_TIMEOUT * len(positions))
+        except asyncio.TimeoutError:
+            print(f"FAILURE: the serves did not finish within {SERVE_TIMEOUT * len(positions)}s")
+            return False
+
+        for name, outcome in zip(POSITIONS_TO_TEST, outcomes):
+            status = outcome["status"]
+            trace = outcome["trace"]
+            result = "SUCCESS" if status == RALLY_TO_AI else "FAILURE"
+            end = "at ({:.3f}, {:.3f}, {:.3f})".format(*trace[-1]) if trace else "before the toss"
+            print(f"{result}: serve from {name} (z={outcome['position'][2]}) ended with ball status {status} "
+                  f"after {len(trace)} frames {end}")
+        return all(outcome["status"] == RALLY_TO_AI for outcome in outcomes)
+    finally:
+        for msg_type, text in logs:
+            print(f"BROWSER {msg_type}: {text}")
+
+async def main(browser):
+    context = await browser.new_context()
+    try:
+        await run(await context.new_page())
+    finally:
+        await context.close()
+
+def run_headless():
+    # The same sweep through the serve physics alone, under Node (Vitest),
+    # for when only the trajectory matters and no browser is needed.
+    return subprocess.run(["npx", "vitest", "run", "tests/unit/serve.test.ts"],
+                          cwd=TS_PORT_DIR).returncode
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--node", action="store_true",
+                        help="simulate the serves under Node instead of in Chromium")
+    args = parser.parse_args()
+    if args.node:
+        sys.exit(run_headless())
+    run_with_browser(main)